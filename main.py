@@ -1,28 +1,78 @@
 import sys
 import asyncio
 import json
-import copy
+import functools
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from html import escape
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from loguru import logger
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QComboBox, QTextEdit,
     QFileDialog, QMessageBox, QCheckBox, QMenuBar, QMenu
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt, QObject, QThread, QTimer, Signal
 from PySide6.QtGui import QIcon
 
 from uploader import hamster_upload_single_image  # your async upload function
+from utils import dump_json_bytes, load_json_bytes, load_json_cached, write_bytes_atomic
 
 # ---------------------- Version ----------------------
-VERSION_FILE = Path(__file__).parent / "VERSION"
+VERSION_FILE = Path(__file__).with_name("VERSION")
 
 try:
-    with open(VERSION_FILE, "r", encoding="utf-8") as f:
-        __version__ = f.read().strip()
+    __version__ = VERSION_FILE.read_text(encoding="utf-8").strip()
 except Exception:
     __version__ = "unknown"
 
+# ---------------------- Files ----------------------
+# Lowercase image extensions accepted for upload, a tuple so it can be passed to str.endswith
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp")
+MAX_UPLOAD_SIZE_BYTES = 8_000_000  # maximum allowed file size in bytes
+# File dialog filter built from the same list, upper-case patterns for case-sensitive platforms
+IMAGE_FILE_FILTER = "Images ({})".format(
+    " ".join(f"*{ext}" for ext in IMAGE_EXTENSIONS + tuple(ext.upper() for ext in IMAGE_EXTENSIONS))
+)
+
+
+def group_results_path(folder):
+    """Path of the group mode results file for folder."""
+    folder = Path(folder)
+    return folder / f"{folder.name}_hamster_results.txt"
+
+
+@dataclass(frozen=True, slots=True)
+class FileBatch:
+    """
+    Files selected for one upload run, stored as parallel tuples.
+    Built once by the GUI after the pre-upload check, the worker only zips over it.
+    """
+    names: tuple[str, ...]
+    paths: tuple[str, ...]
+    sizes: tuple[int, ...]
+    skip: tuple[bool, ...]  # True where the user chose to keep the existing result
+
+    @classmethod
+    def build(cls, candidates, precheck_results):
+        """Build a batch from (path, size) pairs and the pre-upload check answers."""
+        paths = tuple(filepath for filepath, _ in candidates)
+        names = tuple(os.path.basename(filepath) for filepath in paths)
+        return cls(
+            names=names,
+            paths=paths,
+            sizes=tuple(size for _, size in candidates),
+            skip=tuple(precheck_results.get(name) == "skip" for name in names),
+        )
+
+    def __len__(self):
+        return len(self.paths)
+
+
 # ---------------------- Themes ----------------------
 DEFAULT_THEMES = {
     "light": {
@@ -65,130 +115,274 @@ DEFAULT_THEMES = {
     }
 }
 
-# ---------------------- Worker Thread ----------------------
-class UploadWorker(QThread):
+# Read-only fallback for log modes a theme does not color
+_DEFAULT_LOG_COLORS = MappingProxyType(DEFAULT_THEMES["light"]["log_colors"])
+
+# GUI log mode -> loguru method, resolved once instead of per message
+LOG_DISPATCH = {
+    "info": logger.info,
+    "success": logger.success,
+    "warn": logger.warning,
+    "error": logger.error
+}
+# Fixed parts of the console HTML, only the entry divs are built per render
+LOG_HTML_HEADER = (
+    '<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 4.0//EN" '
+    '"http://www.w3.org/TR/REC-html40/strict.dtd">'
+    '<html><head><meta name="qrichtext" content="1" /><meta charset="utf-8" />'
+    '<style type="text/css">p, li { white-space: pre-wrap; }</style></head><body>'
+)
+LOG_HTML_FOOTER = "</body></html>"
+LOG_ENTRY_SUFFIX = "</div>"
+LOG_HISTORY_LIMIT = 5000  # entries kept in memory and in the console, older ones stay in the log file
+
+# ---------------------- Event Loop Thread ----------------------
+class AsyncLoopThread(QThread):
+    """
+    Runs a single asyncio event loop for the lifetime of the app.
+    Upload jobs are scheduled onto it instead of creating a thread and a loop per run.
+    """
+
+    UPLOAD_WORKERS = 4  # threads running blocking HTTP uploads (asyncio.to_thread)
+    IO_WORKERS = 2  # threads reserved for result file reads/writes
+
+    def __init__(self):
+        super().__init__()
+        self.loop = asyncio.new_event_loop()
+        # asyncio.to_thread runs on the loop's default executor, sized to the uploads allowed at once
+        # instead of asyncio's min(32, cpu_count + 4)
+        self.upload_executor = ThreadPoolExecutor(max_workers=self.UPLOAD_WORKERS, thread_name_prefix="hamster-upload")
+        self.loop.set_default_executor(self.upload_executor)
+        # Disk I/O gets its own small pool so it never queues behind blocking HTTP uploads
+        self.io_executor = ThreadPoolExecutor(max_workers=self.IO_WORKERS, thread_name_prefix="hamster-io")
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            try:
+                self._cancel_pending_tasks()
+                self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            finally:
+                self.loop.close()
+                asyncio.set_event_loop(None)
+
+    def _cancel_pending_tasks(self):
+        """
+        Cancel whatever is still scheduled when the loop stops (an upload when the user closes twice)
+        and let the tasks run their cleanup, as asyncio.run does.
+        Blocking requests already running in the executor can't be cancelled, only abandoned.
+        """
+        pending = asyncio.all_tasks(self.loop)
+        if not pending:
+            return
+        for task in pending:
+            task.cancel()
+        self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+    def submit(self, coro):
+        """Schedule coro on the loop from any thread, returns a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def shutdown(self, timeout_ms=3000):
+        if self.isRunning():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.wait(timeout_ms)
+        self.upload_executor.shutdown(wait=False)
+        self.io_executor.shutdown(wait=False)
+
+
+# ---------------------- Upload Worker ----------------------
+class UploadWorker(QObject):
     log_signal = Signal(str, str)
     finished_signal = Signal()
 
-    def __init__(self, files, album_id, api_key, site_url, mode, precheck_results):
+    MAX_CONCURRENT_UPLOADS = AsyncLoopThread.UPLOAD_WORKERS  # uploads in flight at the same time
+    GROUP_FLUSH_INTERVAL = 25  # write the group results file every N successful uploads
+    GROUP_FLUSH_SECONDS = 5  # ... or when pending results are older than this
+
+    def __init__(self, batch, album_id, api_key, site_url, mode, group_data=None):
         super().__init__()
-        self.files = files
+        self.batch = batch
         self.album_id = album_id
         self.api_key = api_key
         self.site_url = site_url
         self.mode = mode
         self._is_running = True
-        self.precheck_results = precheck_results if precheck_results else {}
-
-    def run(self):
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self.async_upload())
-        except Exception as e:
-            self.log_worker_actions(f"❌ Worker crashed: {e}", "error")
-        finally:
-            try:
-                loop.stop()
-            except:
-                pass
-            try:
-                loop.close()
-            except:
-                pass
-            asyncio.set_event_loop(None)
+        self.group_txt_path = None
+        # Group results already parsed by the GUI, None means the worker reads the file itself
+        self.group_data = group_data
+        self._pending_group_writes = 0
+        self._group_file_compact = False  # True while the file on disk holds a compact checkpoint
+        self._last_group_flush = time.monotonic()
+        self._group_lock = None
+        self._upload = None
+        self._stop_event = None  # asyncio.Event on the loop, set by stop() so running uploads stop retrying
+        self._loop = None
+        self._future = None
+        self._io_executor = None
+
+    def start(self, loop_thread):
+        """Schedule the upload job on the shared event loop."""
+        self._io_executor = loop_thread.io_executor
+        self._loop = loop_thread.loop
+        self._future = loop_thread.submit(self.async_upload())
+        self._future.add_done_callback(self._on_done)
+
+    def _on_done(self, future):
+        if not future.cancelled() and future.exception() is not None:
+            self.log_worker_actions(f"❌ Worker crashed: {future.exception()}", "error")
+        # Always notify the UI that the worker finished (success, cancel or error)
+        self.finished_signal.emit()
+
+    def isRunning(self):
+        return self._future is not None and not self._future.done()
 
     def log_worker_actions(self, msg, mode="info"):
         self.log_signal.emit(msg, mode)
 
-    async def async_upload(self):
-        self.log_worker_actions(f"⏳ Starting...", "info")
-        MAX_SIZE_BYTES = 8_000_000  # maximum allowed file size in bytes
+    async def _run_io(self, func, *args):
+        """
+        Run blocking file I/O on the dedicated I/O executor.
+        JSON serialization stays on the loop thread so the dicts are never read while being mutated.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._io_executor, func, *args)
+
+    async def _load_group_data(self):
+        """Load the existing group results file once, before the upload loop starts."""
+        self.group_txt_path = group_results_path(os.path.dirname(self.batch.paths[0]))
+        if self.group_data is not None:
+            return
+        self.group_data = {}
         try:
-            for idx, filepath in enumerate(self.files, start=1):
-                if not self._is_running:
-                    self.log_worker_actions("❌ Upload cancelled by user.", "info")
-                    break
+            raw = await self._run_io(self.group_txt_path.read_bytes)
+        except FileNotFoundError:
+            return
+        try:
+            self.group_data = load_json_bytes(raw)
+        except json.JSONDecodeError:
+            self.log_worker_actions(f"⚠️ Invalid JSON in {self.group_txt_path}, overwriting.", "warn")
 
-                filename = Path(filepath).name
-                # Safely get file size (skip if inaccessible)
-                try:
-                    file_size_bytes = Path(filepath).stat().st_size
-                except Exception as e:
-                    self.log_worker_actions(f"❌ Skipping {filename}: cannot access file ({e}).", "error")
-                    continue
-
-                if file_size_bytes > MAX_SIZE_BYTES:
-                    self.log_worker_actions(
-                        f"❌ Skipping {filename}: File size {file_size_bytes} bytes exceeds 8,000,000 bytes limit.",
-                        "error"
-                    )
-                    continue
+    async def _flush_group_data(self, final=False):
+        """
+        Write the in-memory group results back to disk in one go.
+        Mid-run checkpoints are written compact, the final write is indented for readability.
+        """
+        # Concurrent uploads may trigger a checkpoint at the same time, only one may write
+        async with self._group_lock:
+            if not self._pending_group_writes and not (final and self._group_file_compact):
+                return
+            flushed = self._pending_group_writes
+            try:
+                await self._run_io(
+                    write_bytes_atomic, self.group_txt_path, dump_json_bytes(self.group_data, indent=final)
+                )
+            except Exception as e:
+                self.log_worker_actions(f"❌ Failed to write group results file {self.group_txt_path}: {e}", "error")
+                return
+            # Entries added while the write was in progress stay pending for the next flush
+            self._pending_group_writes -= flushed
+            self._group_file_compact = not final
+            self._last_group_flush = time.monotonic()
+        self.log_worker_actions(f"🗂️ Updated group results file: {self.group_txt_path}", "info")
+
+    async def _upload_one(self, idx, total, filename, filepath, size, skip, semaphore):
+        """Upload one file and record its result, at most MAX_CONCURRENT_UPLOADS at a time."""
+        stem = os.path.splitext(filename)[0]
+
+        if skip:
+            self.log_worker_actions(f"⚠️ Skipping upload for {filename} (user chose keep).", "info")
+            return
+
+        async with semaphore:
+            # Files still waiting for a slot are dropped once the user cancels
+            if not self._is_running:
+                return
 
-                # Guard against missing precheck entry
-                precheck_val = (self.precheck_results.get(filename) or "").lower()
-                if precheck_val == "skip":
-                    self.log_worker_actions(f"⚠️ Skipping upload for {filename} (user chose keep).", "info")
-                    continue
+            self.log_worker_actions(f"({idx}/{total}) Uploading: {filename} ({size:,} bytes)", "info")
 
-                self.log_worker_actions(f"({idx}/{len(self.files)}) Uploading: {filename}", "info")
+            try:
+                result = await self._upload(filepath, stem)
+            except Exception as e:
+                self.log_worker_actions(f"❌ Upload failed for {filename}: {e}", "error")
+                return
 
-                try:
-                    result = await hamster_upload_single_image(
-                        filepath, Path(filename).stem, self.album_id, self.api_key, self.site_url, self.mode
-                    )
-                except Exception as e:
-                    self.log_worker_actions(f"❌ Upload failed for {filename}: {e}", "error")
-                    continue
+        if result and result.get("Direct_URL"):
+            self.log_worker_actions(f"✅ Uploaded: {filename}", "success")
 
-                if result and result.get("Direct_URL"):
-                    self.log_worker_actions(f"✅ Uploaded: {filename}", "success")
+            try:
+                # === SINGLE MODE ===
+                if self.mode == "single":
+                    txt_path = os.path.join(os.path.dirname(filepath), f"{stem}_hamster.txt")
+                    await self._run_io(write_bytes_atomic, txt_path, dump_json_bytes({filename: result}))
+                    self.log_worker_actions(f"📝 Wrote single result file: {txt_path}", "info")
+
+                # === GROUP MODE ===
+                elif self.mode == "group":
+                    # Add or update entry in memory, the file is written in checkpoints
+                    self.group_data[filename] = result
+                    self._pending_group_writes += 1
+                    if (
+                        self._pending_group_writes >= self.GROUP_FLUSH_INTERVAL
+                        or time.monotonic() - self._last_group_flush >= self.GROUP_FLUSH_SECONDS
+                    ):
+                        await self._flush_group_data()
+
+            except Exception as e:
+                self.log_worker_actions(f"❌ Failed to write results file for {filename}: {e}", "error")
+        else:
+            self.log_worker_actions(f"❌ Failed: {filename}", "error")
 
-                    try:
-                        # === SINGLE MODE ===
-                        if self.mode == "single":
-                            txt_path = Path(filepath).with_name(f"{Path(filepath).stem}_hamster.txt")
-                            with open(txt_path, "w", encoding="utf-8") as f:
-                                json.dump({filename: result}, f, indent=2)
-                            self.log_worker_actions(f"📝 Wrote single result file: {txt_path}", "info")
-
-                        # === GROUP MODE ===
-                        elif self.mode == "group":
-                            folder = Path(filepath).parent
-                            group_txt_path = folder / f"{folder.name}_hamster_results.txt"
-
-                            # Load existing data if file exists
-                            group_data = {}
-                            if group_txt_path.exists():
-                                try:
-                                    with open(group_txt_path, "r", encoding="utf-8") as f:
-                                        group_data = json.load(f)
-                                except json.JSONDecodeError:
-                                    self.log_worker_actions(f"⚠️ Invalid JSON in {group_txt_path}, overwriting.", "warn")
-
-                            # Add or update entry
-                            group_data[filename] = result
-
-                            # Write back to file
-                            with open(group_txt_path, "w", encoding="utf-8") as f:
-                                json.dump(group_data, f, indent=2)
-
-                            self.log_worker_actions(f"🗂️ Updated group results file: {group_txt_path}", "info")
-
-                    except Exception as e:
-                        self.log_worker_actions(f"❌ Failed to write results file for {filename}: {e}", "error")
-                else:
-                    self.log_worker_actions(f"❌ Failed: {filename}", "error")
+    async def async_upload(self):
+        self.log_worker_actions(f"⏳ Starting...", "info")
+        self._group_lock = asyncio.Lock()
+        self._stop_event = asyncio.Event()
+        if not self._is_running:  # stopped before the job got to run
+            self._stop_event.set()
+        # Settings are fixed for the whole run, bind them once instead of per file
+        self._upload = functools.partial(
+            hamster_upload_single_image,
+            hamster_album_id=self.album_id, hamster_api_key=self.api_key, site_url=self.site_url, mode=self.mode,
+            stop_event=self._stop_event
+        )
+        try:
+            batch = self.batch
+            if self.mode == "group" and batch:
+                await self._load_group_data()
+
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_UPLOADS)
+            total = len(batch)
+            outcomes = await asyncio.gather(
+                *(
+                    self._upload_one(idx, total, filename, filepath, size, skip, semaphore)
+                    for idx, (filename, filepath, size, skip) in enumerate(
+                        zip(batch.names, batch.paths, batch.sizes, batch.skip), start=1
+                    )
+                ),
+                return_exceptions=True
+            )
+            for filename, outcome in zip(batch.names, outcomes):
+                if isinstance(outcome, Exception):
+                    self.log_worker_actions(f"❌ Upload failed for {filename}: {outcome}", "error")
+
+            if not self._is_running:
+                self.log_worker_actions("❌ Upload cancelled by user.", "info")
 
         except Exception as e:
             # Top-level unexpected error — log it so UI can show the problem
             self.log_worker_actions(f"❌ Worker encountered an error: {e}", "error")
         finally:
-            # Always notify the UI that the worker finished (success, cancel or error)
-            self.finished_signal.emit()
+            # Persist any group results not yet written by a checkpoint
+            if self.mode == "group":
+                await self._flush_group_data(final=True)
 
     def stop(self):
+        """Called from the GUI thread: skip queued files and stop retries of the uploads in flight."""
         self._is_running = False
+        if self._stop_event is not None:
+            # asyncio.Event is not thread-safe, set it from the loop thread
+            self._loop.call_soon_threadsafe(self._stop_event.set)
 
 
 # ---------------------- Main GUI ----------------------
@@ -234,6 +428,8 @@ class HamsterUploaderGUI(QWidget):
         # File/folder selection
         self.path_label = QLabel("Select folder path:")
         self.path_input = QLineEdit()
+        self._parsed_paths = ()
+        self.path_input.textChanged.connect(self._parse_path_input)
         self.ignore_album_missing = None
         self.browse_button = QPushButton("Browse")
         self.browse_button.clicked.connect(self.browse_path)
@@ -266,11 +462,20 @@ class HamsterUploaderGUI(QWidget):
         self.layout.addLayout(hbox_api)
 
         # Keep a structured in-memory log so we can fully re-render on theme change
-        self.log_entries = []  # list of (mode, text) tuples
+        self.log_entries = deque(maxlen=LOG_HISTORY_LIMIT)  # (mode, text) tuples, oldest dropped first
+        self._log_pending = deque()  # entries not yet shown in the console
+        self._log_prefix = {}  # mode -> opening div for the current theme, built in apply_theme
 
         # Console/log output
         self.log_output = QTextEdit()
         self.log_output.setReadOnly(True)
+        # Each entry is one block, Qt drops the oldest blocks itself once the limit is reached
+        self.log_output.document().setMaximumBlockCount(LOG_HISTORY_LIMIT)
+        # Repaint the console at most once per 100ms, however many messages arrive in between
+        self._log_render_timer = QTimer(self)
+        self._log_render_timer.setSingleShot(True)
+        self._log_render_timer.setInterval(100)
+        self._log_render_timer.timeout.connect(self._flush_logs)
         self.log_actions(f"Hamster Image Uploader Started {__version__}", "info")
         self.layout.addWidget(QLabel("Console Output:"))
         self.layout.addWidget(self.log_output)
@@ -287,7 +492,11 @@ class HamsterUploaderGUI(QWidget):
 
 
         # Internal
+        self.loop_thread = AsyncLoopThread()
+        self.loop_thread.start()
         self.upload_worker = None
+        self._closing = False  # set once a close is waiting for the running upload to finish
+        self._settings_written = {}  # path -> (bytes, mtime_ns, size) of the last settings save
         self.site_url = None
         self.album_id_hidden = None
         self.api_key_hidden = None
@@ -300,32 +509,31 @@ class HamsterUploaderGUI(QWidget):
         # Load config.json
         view_mode = "light"
         try:
-            with open("config.json", "r", encoding="utf-8") as f:
-                config = json.load(f)
-                self.path_input.setText(config.get("working_path", ""))
-                self.ignore_album_missing = config.get("ignore_album_missing", self.ignore_album_missing)
-                self.mode_combo.setCurrentText(config.get("upload_mode", "single"))
-                view_mode = config.get("view_mode", view_mode)
+            config = load_json_cached("config.json")
+            self.path_input.setText(config.get("working_path", ""))
+            self.ignore_album_missing = config.get("ignore_album_missing", self.ignore_album_missing)
+            self.mode_combo.setCurrentText(config.get("upload_mode", "single"))
+            view_mode = config.get("view_mode", view_mode)
         except FileNotFoundError:
             self.log_actions("⚠️ config.json not found, using defaults.", "error")
         except json.JSONDecodeError:
             self.log_actions("⚠️ Invalid JSON in config.json, using defaults.", "error")
 
         try:
-            with open("themes.json", "r", encoding="utf-8") as f:
-                loaded = json.load(f)
-                # Validate minimal structure (must be dict with keys)
-                if isinstance(loaded, dict) and loaded:
-                    self.themes = copy.deepcopy(loaded)
-                else:
-                    self.log_actions("⚠️ Invalid structure in themes.json, using defaults.", "warn")
-                    self.themes = copy.deepcopy(DEFAULT_THEMES)
+            loaded = load_json_cached("themes.json")
+            # Validate minimal structure (must be dict with keys)
+            if isinstance(loaded, dict) and loaded:
+                # Themes are only read, apply_theme copies the log colors it keeps
+                self.themes = loaded
+            else:
+                self.log_actions("⚠️ Invalid structure in themes.json, using defaults.", "warn")
+                self.themes = DEFAULT_THEMES
         except FileNotFoundError:
             self.log_actions("⚠️ themes.json not found, using default themes.", "warn")
-            self.themes = copy.deepcopy(DEFAULT_THEMES)
+            self.themes = DEFAULT_THEMES
         except json.JSONDecodeError:
             self.log_actions("⚠️ Invalid JSON in themes.json, using default themes.", "warn")
-            self.themes = copy.deepcopy(DEFAULT_THEMES)
+            self.themes = DEFAULT_THEMES
 
         # Apply theme (after view_mode resolved)
         # ensure the dark_mode_action exists
@@ -338,13 +546,12 @@ class HamsterUploaderGUI(QWidget):
 
         # Load creds.secret
         try:
-            with open("creds.secret", "r", encoding="utf-8") as f:
-                creds = json.load(f)
-                self.album_id_hidden = creds.get("hamster_album_id")
-                self.api_key_hidden = creds.get("hamster_api_key")
-                self.site_url = creds.get("hamster_site_url")
-                self.album_checkbox.setChecked(bool(self.album_id_hidden))
-                self.api_checkbox.setChecked(bool(self.api_key_hidden))
+            creds = load_json_cached("creds.secret")
+            self.album_id_hidden = creds.get("hamster_album_id")
+            self.api_key_hidden = creds.get("hamster_api_key")
+            self.site_url = creds.get("hamster_site_url")
+            self.album_checkbox.setChecked(bool(self.album_id_hidden))
+            self.api_checkbox.setChecked(bool(self.api_key_hidden))
         except FileNotFoundError:
             self.log_actions("⚠️ creds.secret not found, API key and Album ID empty.", "error")
         except json.JSONDecodeError:
@@ -364,7 +571,13 @@ class HamsterUploaderGUI(QWidget):
         stylesheet = theme.get("stylesheet", "")
         self.setStyleSheet(stylesheet)
 
-        self.current_log_colors = theme.get("log_colors", {}).copy() if isinstance(theme.get("log_colors"), dict) else DEFAULT_THEMES["light"]["log_colors"].copy()
+        self.current_log_colors = theme.get("log_colors", {}).copy() if isinstance(theme.get("log_colors"), dict) else dict(_DEFAULT_LOG_COLORS)
+        # Build the opening div per mode once, rendering is then plain concatenation
+        merged_colors = {**_DEFAULT_LOG_COLORS, **self.current_log_colors}
+        self._log_prefix = {
+            mode: f'<div class="log-entry log-{mode}" style="color:{color}; white-space: pre-wrap;">'
+            for mode, color in merged_colors.items()
+        }
 
         # Re-render logs using the new theme colors
         try:
@@ -373,7 +586,6 @@ class HamsterUploaderGUI(QWidget):
             # avoid recursion: use logger, and append a plain message
             logger.exception(f"Error while re-rendering logs: {e}")
             # fallback: if something went wrong, at least show an inline message
-            from html import escape
             self.log_output.insertHtml(
                 f'<div style="color:#FF0000">⚠️ Could not repaint log entries: {escape(str(e))}</div>'
             )
@@ -387,6 +599,7 @@ class HamsterUploaderGUI(QWidget):
                 pass
 
         self.current_view_mode = theme_name
+        self._help_texts = self._build_help_texts(theme_name)
 
     def on_toggle_dark_mode(self):
         """Toggle between 'light' and 'dark' and persist to config.json."""
@@ -399,46 +612,31 @@ class HamsterUploaderGUI(QWidget):
         # persist to config.json (preserve other keys)
         try:
             cfg_path = Path("config.json")
-            cfg = {}
-            if cfg_path.exists():
-                try:
-                    with open(cfg_path, "r", encoding="utf-8") as f:
-                        cfg = json.load(f)
-                except Exception:
-                    cfg = {}
+            try:
+                cfg = dict(load_json_cached(cfg_path))  # the cached parse must stay untouched
+            except Exception:
+                cfg = {}
             cfg["view_mode"] = new_mode
             cfg.setdefault("available_view_modes", ["light", "dark"])
             cfg.setdefault("working_path", self.path_input.text())
             cfg.setdefault("upload_mode", self.mode_combo.currentText())
-            with open(cfg_path, "w", encoding="utf-8") as f:
-                json.dump(cfg, f, indent=2)
+            write_bytes_atomic(cfg_path, dump_json_bytes(cfg))
         except Exception as e:
             self.log_actions(f"❌ Failed to persist view mode: {e}", "error")
         else:
             self.log_actions(f"Switched to {new_mode} theme", "success")
 
-    def show_about(self):
+    def _build_help_texts(self, theme_name):
+        """Build the About/Instructions/Issues bodies once per theme, links are white on non-light themes."""
+        link_style = "" if theme_name == "light" else ' style="color:white"'
         about_text = f"""
         <b>About Hamster Image Uploader</b><br>
         Version: {__version__}<br><br>
         Developed by edstagdh<br><br>
         This tool allows easy batch uploads of images to Hamster.<br><br>
-        """
-        about_text += """
-        <a href="https://github.com/edstagdh/Hamster_Image_Uploader">
-            GitHub Repository
-        </a>""" if self.current_view_mode == "light" else """<a style="color:white" href="https://github.com/edstagdh/Hamster_Image_Uploader">
+        <a{link_style} href="https://github.com/edstagdh/Hamster_Image_Uploader">
             GitHub Repository
         </a>"""
-
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("Hamster Image Uploader - About")
-        msg_box.setTextFormat(Qt.RichText)  # Enable HTML formatting
-        msg_box.setText(about_text)
-        msg_box.setStandardButtons(QMessageBox.Ok)
-        msg_box.exec()
-
-    def show_instructions(self):
         instructions_text = f"""
         Instructions - Version: {__version__}<br><br>
         
@@ -446,71 +644,73 @@ class HamsterUploaderGUI(QWidget):
         2. Browse and select the file(s) or folder path.<br>
         3. Ensure your Hamster API Key and Hamster Album ID(Optional) are configured in creds.secret OR insert them in relevant input boxes<br>
         
-        """
-        instructions_text += """
-        <a href="https://github.com/edstagdh/Hamster_Image_Uploader/blob/master/README.md">
-            Instructions are available in README file
-        </a>""" if self.current_view_mode == "light" else """<a style="color:white" href="https://github.com/edstagdh/Hamster_Image_Uploader/blob/master/README.md">
+        <a{link_style} href="https://github.com/edstagdh/Hamster_Image_Uploader/blob/master/README.md">
             Instructions are available in README file
         </a>"""
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("Hamster Image Uploader - Instructions")
-        msg_box.setTextFormat(Qt.RichText)  # Enable HTML formatting
-        msg_box.setText(instructions_text)
-        msg_box.setStandardButtons(QMessageBox.Ok)
-        msg_box.exec()
-
-    def show_issues(self):
         issues_text = f"""
-        Issues - Version: {__version__}<br><br>"""
-        issues_text += """
-        <a href="https://github.com/edstagdh/Hamster_Image_Uploader/issues">
-            Please submit an issue via Github Issues page
-        </a>""" if self.current_view_mode == "light" else """<a style="color:white" href="https://github.com/edstagdh/Hamster_Image_Uploader/issues">
+        Issues - Version: {__version__}<br><br>
+        <a{link_style} href="https://github.com/edstagdh/Hamster_Image_Uploader/issues">
             Please submit an issue via Github Issues page
         </a>"""
+        return {"about": about_text, "instructions": instructions_text, "issues": issues_text}
+
+    def _show_help_box(self, title, text):
         msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("Hamster Image Uploader - Issues")
+        msg_box.setWindowTitle(title)
         msg_box.setTextFormat(Qt.RichText)  # Enable HTML formatting
-        msg_box.setText(issues_text)
+        msg_box.setText(text)
         msg_box.setStandardButtons(QMessageBox.Ok)
         msg_box.exec()
 
+    def show_about(self):
+        self._show_help_box("Hamster Image Uploader - About", self._help_texts["about"])
+
+    def show_instructions(self):
+        self._show_help_box("Hamster Image Uploader - Instructions", self._help_texts["instructions"])
+
+    def show_issues(self):
+        self._show_help_box("Hamster Image Uploader - Issues", self._help_texts["issues"])
+
     def log_actions(self, msg, mode="info"):
         """
-        Add a log entry to the in-memory list and re-render the QTextEdit.
+        Add a log entry to the in-memory list and schedule it for display in the QTextEdit.
         mode: one of 'info', 'success', 'warn', 'error'
         """
-        # Ensure color map exists
-        default_map = {
-            "info": "#000000",
-            "success": "#2e7d32",
-            "warn": "#f57c00",
-            "error": "#d32f2f"
-        }
-        color_map = getattr(self, "current_log_colors", None) or getattr(self, "themes", {}).get("light", {}).get("log_colors", default_map)
-        color = color_map.get(mode, default_map.get(mode, "#000000"))
-
-        from html import escape
+        # Colors are applied at render time from the prefixes built in apply_theme
         safe_msg = escape(msg).replace("\n", "<br>")
 
         # store structured entry
         self.log_entries.append((mode, safe_msg))
-        if len(self.log_entries) > 5000:
-            self.log_entries = self.log_entries[-5000:]
+        self._log_pending.append((mode, safe_msg))
 
-        # re-render the whole log using current theme colors
-        self._render_logs()
+        # schedule the console update
+        if not self._log_render_timer.isActive():
+            self._log_render_timer.start()
 
         # Keep external logger behavior for file/console logs
-        if mode == "info":
-            logger.info(msg)
-        elif mode == "success":
-            logger.success(msg)
-        elif mode == "warn":
-            logger.warning(msg)
-        else:
-            logger.error(msg)
+        LOG_DISPATCH.get(mode, logger.error)(msg)
+
+    def _log_entries_html(self, entries):
+        """
+        Return the HTML blocks for (mode, safe_msg) entries, colored for the current theme.
+        Each entry is wrapped in a div with a class so the HTML structure is predictable.
+        """
+        prefix = self._log_prefix
+        default_prefix = prefix.get("info", '<div class="log-entry" style="white-space: pre-wrap;">')
+        return "".join(prefix.get(mode, default_prefix) + safe_msg + LOG_ENTRY_SUFFIX for mode, safe_msg in entries)
+
+    def _flush_logs(self):
+        """Append every entry logged since the last flush to the QTextEdit in a single call."""
+        if not self._log_pending:
+            return
+        try:
+            batch_html = self._log_entries_html(self._log_pending)
+            self._log_pending.clear()
+            self.log_output.append(batch_html)
+            self.log_output.ensureCursorVisible()
+        except Exception as e:
+            # Do not call self.log_actions here (would recurse) — use logger
+            logger.exception(f"Failed to append logs: {e}")
 
     def _render_logs(self):
         """
@@ -518,37 +718,12 @@ class HamsterUploaderGUI(QWidget):
         current_log_colors. This is the single source of truth for displayed logs.
         """
         try:
-            # Build HTML document body: use paragraphs for each entry.
-            parts = []
-            for mode, safe_msg in self.log_entries:
-                color = (getattr(self, "current_log_colors", {}) or {}).get(mode)
-                if not color:
-                    # fallback map
-                    fallback = {
-                        "info": "#000000",
-                        "success": "#2e7d32",
-                        "warn": "#f57c00",
-                        "error": "#d32f2f"
-                    }
-                    color = fallback.get(mode, "#000000")
-
-                # We wrap each entry in a div with a class so the HTML structure is predictable
-                parts.append(
-                    f'<div class="log-entry log-{mode}" style="color:{color}; white-space: pre-wrap;">'
-                    f'{safe_msg}'
-                    f'</div>'
-                )
-
-            body_html = "".join(parts)
+            # Build HTML document body: one div per entry
+            body_html = self._log_entries_html(self.log_entries)
+            self._log_pending.clear()
 
-            # Use insertHtml with a minimal HTML wrapper so Qt treats it as rich text
-            full_html = (
-                '<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 4.0//EN" '
-                '"http://www.w3.org/TR/REC-html40/strict.dtd">'
-                '<html><head><meta name="qrichtext" content="1" /><meta charset="utf-8" />'
-                '<style type="text/css">p, li { white-space: pre-wrap; }</style></head>'
-                f'<body>{body_html}</body></html>'
-            )
+            # Use a minimal HTML wrapper so Qt treats it as rich text
+            full_html = LOG_HTML_HEADER + body_html + LOG_HTML_FOOTER
 
             # Replace document in one operation to avoid incremental escapes
             self.log_output.setHtml(full_html)
@@ -558,23 +733,22 @@ class HamsterUploaderGUI(QWidget):
             # Do not call self.log_actions here (would recurse) — use logger
             logger.exception(f"Failed to render logs: {e}")
 
-    def pre_upload_validation(self):
-        """Validate that the path input matches the selected mode (group/single)."""
-        mode = self.mode_combo.currentText()
-        path_text = self.path_input.text().strip()
-
+    def pre_upload_validation(self, mode, path_text, paths):
+        """
+        Validate that the path input matches the selected mode (group/single).
+        paths: the ';' separated single mode paths, already split by the caller.
+        """
         if not path_text:
             QMessageBox.warning(self, "Warning", "Please select a valid file or folder path.")
             return False
 
         if mode == "group":
-            folder = Path(path_text)
-            if not folder.exists() or not folder.is_dir():
+            # os.path.isdir/isfile answer "exists and has this type" with a single stat() call
+            if not os.path.isdir(path_text):
                 QMessageBox.warning(self, "Error", "Group mode requires a valid folder path.")
                 return False
         elif mode == "single":
-            paths = path_text.split(";")
-            if not all(Path(p).exists() and Path(p).is_file() for p in paths):
+            if not all(os.path.isfile(p) for p in paths):
                 QMessageBox.warning(self, "Error", "Single mode requires valid file paths (separated by ';').")
                 return False
         else:
@@ -593,11 +767,18 @@ class HamsterUploaderGUI(QWidget):
         self.path_input.clear()
         # self.log_actions(f"🔄 Upload mode changed to '{mode}', path input reset.", "info")
 
+    def _parse_path_input(self, text):
+        """
+        Split the path input into single mode paths once per edit instead of on every Start.
+        Whitespace around each path is dropped, so "a.jpg; b.jpg" and a trailing ";" both work.
+        """
+        self._parsed_paths = tuple(p for p in map(str.strip, text.split(";")) if p)
+
     def browse_path(self):
         mode = self.mode_combo.currentText()
         if mode == "single":
             files, _ = QFileDialog.getOpenFileNames(
-                self, "Select Image Files", "", "Images (*.jpg *.jpeg *.png *.gif *.webp *.JPG *.JPEG *.PNG *.GIF *.WEBP)"
+                self, "Select Image Files", "", IMAGE_FILE_FILTER
             )
             if files:
                 self.path_input.setText(";".join(files))
@@ -607,64 +788,114 @@ class HamsterUploaderGUI(QWidget):
                 self.path_input.setText(folder)
 
     # ----------------- Pre-upload logic -----------------
-    def pre_upload_check(self, files, mode):
+    def _load_group_results(self, group_txt_path):
+        """
+        Return the parsed group results file ({} if missing or invalid).
+        The last parse is reused while the file's mtime and size are unchanged.
+        """
+        try:
+            return load_json_cached(group_txt_path)
+        except FileNotFoundError:
+            return {}
+        except Exception:
+            self.log_actions("⚠️ Invalid JSON in existing group file, will overwrite.", "error")
+            return {}
+
+    def pre_upload_check(self, files, mode, group_data=None):
         """Return dict with files/keys marked 'skip' if user chooses to keep existing data"""
-        results = {}
+        group_data = group_data or {}
+        existing = []  # (filename, question) for every file that already has results
         if mode == "single":
+            title = "File exists"
+            # One stat() per result file, listing the parent folders would cost more for large picture folders
             for filepath in files:
-                filename = Path(filepath).name
-                base_name = Path(filepath).stem
-                txt_path = Path(filepath).parent / f"{base_name}_hamster.txt"
-                if txt_path.exists():
-                    answer = QMessageBox.question(
-                        self, "File exists",
-                        f"{txt_path} exists. Overwrite?",
-                        QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
-                    )
-                    if answer == QMessageBox.Yes:
-                        results[filename] = "overwrite"
-                    elif answer == QMessageBox.No:
-                        results[filename] = "skip"
-                    else:
-                        return None
+                path = Path(filepath)
+                txt_path = path.with_name(f"{path.stem}_hamster.txt")
+                if os.path.exists(txt_path):
+                    existing.append((path.name, f"{txt_path} exists. Overwrite?"))
         else:  # group mode
-            folder = Path(self.path_input.text())
-            group_txt_path = folder / f"{folder.name}_hamster_results.txt"
-            group_data = {}
-            if group_txt_path.exists():
-                try:
-                    with open(group_txt_path, "r", encoding="utf-8") as f:
-                        group_data = json.load(f)
-                except Exception:
-                    self.log_actions("⚠️ Invalid JSON in existing group file, will overwrite.", "error")
-
+            title = "Existing link detected"
             for filepath in files:
                 filename = Path(filepath).name
                 if filename in group_data:
-                    answer = QMessageBox.question(
-                        self, "Existing link detected",
-                        f"Data exists for {filename} in group file. Overwrite?",
-                        QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
-                    )
-                    if answer == QMessageBox.Yes:
-                        results[filename] = "overwrite"
-                    elif answer == QMessageBox.No:
-                        results[filename] = "skip"
-                    else:
-                        return None
+                    existing.append((filename, f"Data exists for {filename} in group file. Overwrite?"))
+
+        results = {}
+        bulk_choice = None  # set once the user answers "Yes to All" / "No to All"
+        for filename, question in existing:
+            if bulk_choice:
+                results[filename] = bulk_choice
+                continue
+            answer = QMessageBox.question(
+                self, title, question,
+                QMessageBox.Yes | QMessageBox.YesToAll | QMessageBox.No | QMessageBox.NoToAll | QMessageBox.Cancel
+            )
+            if answer in (QMessageBox.Yes, QMessageBox.YesToAll):
+                results[filename] = "overwrite"
+            elif answer in (QMessageBox.No, QMessageBox.NoToAll):
+                results[filename] = "skip"
+            else:
+                return None
+            if answer in (QMessageBox.YesToAll, QMessageBox.NoToAll):
+                bulk_choice = results[filename]
         return results
 
+    def _list_candidates(self, mode, path_text, paths):
+        """
+        Return (path, size) for every file to upload.
+        Files that can't be stat'ed (deleted or unreadable since validation) are logged and left out.
+        """
+        candidates = []
+        if mode == "single":
+            for filepath in paths:
+                try:
+                    candidates.append((filepath, os.stat(filepath).st_size))
+                except OSError as e:
+                    self.log_actions(f"❌ Skipping {os.path.basename(filepath)}: {e}", "error")
+            return candidates
+
+        # scandir exposes the entry type from the directory listing, no Path object per entry
+        try:
+            with os.scandir(path_text) as entries:
+                for entry in entries:
+                    if not entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                        continue
+                    try:
+                        if entry.is_file():
+                            candidates.append((entry.path, entry.stat().st_size))
+                    except OSError as e:
+                        self.log_actions(f"❌ Skipping {entry.name}: {e}", "error")
+        except OSError as e:
+            self.log_actions(f"❌ Cannot list folder {path_text}: {e}", "error")
+        return candidates
+
+    def _drop_oversized(self, candidates):
+        """Return the (path, size) candidates within the upload size limit, logging the rest."""
+        kept = []
+        for filepath, size in candidates:
+            if size > MAX_UPLOAD_SIZE_BYTES:
+                self.log_actions(
+                    f"❌ Skipping {Path(filepath).name}: File size {size} bytes exceeds "
+                    f"{MAX_UPLOAD_SIZE_BYTES:,} bytes limit.",
+                    "error"
+                )
+            else:
+                kept.append((filepath, size))
+        return kept
+
     # ----------------- Start / Cancel -----------------
     def toggle_upload(self):
         if self.upload_worker and self.upload_worker.isRunning():
             self.upload_worker.stop()
             self.button_start.setEnabled(False)
         else:
-            if not self.pre_upload_validation():
-                return
+            mode = self.mode_combo.currentText()
             path_text = self.path_input.text().strip()
+            # Parsed when the input changes, shared by validation and the file list below
+            paths = self._parsed_paths if mode == "single" else None
+            if not self.pre_upload_validation(mode, path_text, paths):
+                return
 
-            mode = self.mode_combo.currentText()
             # Use hidden creds if input is empty
             album_id = self.album_input.text().strip() or self.album_id_hidden
             api_key = self.api_input.text().strip() or self.api_key_hidden
@@ -677,29 +908,31 @@ class HamsterUploaderGUI(QWidget):
             if not album_id and not self.ignore_album_missing:
                 QMessageBox.warning(self, "Warning", "Album ID not detected, uploading to main profile.")
 
-            # Build file list
-            if mode == "single":
-                files = path_text.split(";")
-            else:
-                folder = Path(path_text)
-                valid_exts = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
-                files = [str(f) for f in folder.iterdir() if f.suffix.lower() in valid_exts]
+            # Build file list, oversized files are dropped here so they never reach the worker
+            candidates = self._drop_oversized(self._list_candidates(mode, path_text, paths))
 
-            if not files:
+            if not candidates:
                 QMessageBox.warning(self, "Warning", "No valid image files found.")
                 return
 
+            # Parse the group results once, shared by the pre-upload check and the worker
+            group_data = self._load_group_results(group_results_path(path_text)) if mode == "group" else None
+
             # Pre-upload checks
-            precheck_results = self.pre_upload_check(files, mode)
+            precheck_results = self.pre_upload_check([filepath for filepath, _ in candidates], mode, group_data)
             # logger.debug(precheck_results)
             if precheck_results is None:
                 self.log_actions("❌ Upload cancelled by user.", "info")
                 return
 
-            self.upload_worker = UploadWorker(files, album_id, api_key, site_url, mode, precheck_results)
+            self.upload_worker = UploadWorker(
+                FileBatch.build(candidates, precheck_results), album_id, api_key, site_url, mode,
+                # the worker mutates its copy, the cached parse stays untouched
+                dict(group_data) if group_data is not None else None
+            )
             self.upload_worker.log_signal.connect(self.log_actions)
             self.upload_worker.finished_signal.connect(self.upload_finished)
-            self.upload_worker.start()
+            self.upload_worker.start(self.loop_thread)
             self.button_start.setText("Cancel")
 
     def upload_finished(self):
@@ -708,12 +941,41 @@ class HamsterUploaderGUI(QWidget):
         self.button_start.setText("Start")
 
     def closeEvent(self, event):
-        if self.upload_worker and self.upload_worker.isRunning():
+        if self.upload_worker and self.upload_worker.isRunning() and not self._closing:
+            # Let the uploads in flight finish their current attempt (no more retries) and record them,
+            # without freezing the window, the worker closes it when done
+            self._closing = True
             self.upload_worker.stop()
-            self.upload_worker.wait(3000)
+            self.upload_worker.finished_signal.connect(self.close)
+            self.button_start.setEnabled(False)
+            self.log_actions(
+                "⏳ Finishing running uploads before closing, close again to quit without recording them.", "warn"
+            )
+            event.ignore()
+            return
+        # Stopping the loop cancels a worker still running, its group results so far are still saved.
+        # A request already being sent can't be interrupted, the process exits once it returns.
+        self.loop_thread.shutdown()
         super().closeEvent(event)
 
     # ----------------- Save Settings -----------------
+    def _write_settings_file(self, path, data):
+        """
+        Atomically write data to a settings file unless it still holds exactly what was last saved.
+        Returns False when the write was skipped.
+        """
+        try:
+            st = os.stat(path)
+            current = (data, st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            current = None
+        if current is not None and self._settings_written.get(path) == current:
+            return False
+        write_bytes_atomic(path, data)
+        st = os.stat(path)
+        self._settings_written[path] = (data, st.st_mtime_ns, st.st_size)
+        return True
+
     def save_settings(self):
         config = {
             "working_path": self.path_input.text(),
@@ -742,23 +1004,29 @@ class HamsterUploaderGUI(QWidget):
         else:
             creds["hamster_api_key"] = self.api_key_hidden
 
+        # The site URL can only be set in creds.secret, rewriting the file must not drop it
+        if self.site_url:
+            creds["hamster_site_url"] = self.site_url
+
         try:
-            with open("config.json", "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=2)
+            changed = self._write_settings_file("config.json", dump_json_bytes(config))
 
             # ✅ Only write creds if we have at least one non-empty field
             if creds.get("hamster_album_id") or creds.get("hamster_api_key"):
-                with open("creds.secret", "w", encoding="utf-8") as f:
-                    json.dump(creds, f, indent=2)
+                changed = self._write_settings_file("creds.secret", dump_json_bytes(creds)) or changed
 
-            self.log_actions("💾 Settings saved.", "success")
+            if changed:
+                self.log_actions("💾 Settings saved.", "success")
+            else:
+                self.log_actions("💾 Settings unchanged, nothing to save.", "info")
 
         except Exception as e:
             self.log_actions(f"❌ Failed to save settings: {e}", "error")
 
 
 if __name__ == "__main__":
-    logger.add("App_Log_{time:YYYY.MMMM}.log", rotation="30 days", backtrace=True, enqueue=False, catch=True)
+    # enqueue=True: file formatting and writes happen on loguru's worker thread, not the GUI thread
+    logger.add("App_Log_{time:YYYY.MMMM}.log", rotation="30 days", backtrace=True, enqueue=True, catch=True)
 
     app = QApplication(sys.argv)
     font = app.font()
@@ -767,7 +1035,6 @@ if __name__ == "__main__":
         ps = float(font.pixelSize() or 12.0)
     font.setPointSizeF(ps * 1.2)
     app.setFont(font)
-    ps = font.pointSizeF()
     gui = HamsterUploaderGUI()
     gui.show()
 
@@ -1,13 +1,94 @@
-import requests
 import asyncio
 from loguru import logger
 import os
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
+from utils import load_json_bytes
 
-async def upload_to_hamster(hamster_api_key, site_url, data, files=None):
+# Idle keep-alive connections kept per host, must cover the uploads the GUI runs at once
+# (UploadWorker.MAX_CONCURRENT_UPLOADS) or extra connections are closed after each request
+HTTP_POOL_SIZE = 10
+
+_session = None  # created by _get_session on the first upload
+
+
+def _get_session():
+    """
+    Return the shared upload session, created on first use.
+    One session for every upload, so keep-alive connections (TCP + TLS) are reused across files and runs.
+    requests is imported here rather than at module level, it adds ~60 ms to GUI startup otherwise.
+    """
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, max_retries=0)  # retries are handled below
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+    return _session
+
+# Form fields sent with every upload, only the title (and optional album) differ per file
+_BASE_DATA = {
+    "format": "json",
+    "nsfw": 1
+}
+
+INVALID_RESPONSE_PREVIEW_BYTES = 512  # bytes of a non-JSON response body written to the log
+
+RETRY_BASE_DELAY = 2  # seconds, windows of 2 s then 4 s keep the old fixed 2 s + 4 s retry span
+RETRY_MAX_DELAY = 30  # cap for one sleep, in practice for a server's Retry-After
+
+
+def _backoff_delay(retry, retry_after=None):
+    """
+    Seconds to wait before retry number `retry` (1-based).
+    Honors the server's Retry-After when given, otherwise capped exponential backoff with full jitter,
+    so concurrent uploads that failed together don't retry in lockstep.
+    """
+    if retry_after is not None:
+        return min(retry_after, RETRY_MAX_DELAY)
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (retry - 1)))
+
+
+def _retry_after_seconds(response):
+    """Seconds requested by a Retry-After header (delta-seconds or HTTP date), None if absent or invalid."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _rewind_files(files):
+    """Seek every file object back to the start, a failed attempt has already read it."""
+    for part in (files or {}).values():
+        fileobj = part[1] if isinstance(part, tuple) else part
+        if hasattr(fileobj, "seek"):
+            fileobj.seek(0)
+
+
+async def upload_to_hamster(hamster_api_key, site_url, data, files=None, stop_event=None):
     """
     Upload image using multipart/form-data.
+    Once stop_event (an asyncio.Event) is set, no further attempt is made and a pending retry sleep ends early.
     """
+    import requests  # already loaded by _get_session after the first upload
+
+    session = _get_session()
     url = f"{site_url}/api/1/upload"
     headers = {
         "X-API-Key": hamster_api_key,
@@ -15,27 +96,56 @@ async def upload_to_hamster(hamster_api_key, site_url, data, files=None):
     }
 
     max_retries = 3
+    retry_after = None
     for attempt in range(1, max_retries + 1):
+        if attempt > 1:
+            sleep_time = _backoff_delay(attempt - 1, retry_after)
+            retry_after = None
+            if stop_event is not None and stop_event.is_set():
+                logger.warning("Upload stopped, not retrying.")
+                return None
+            logger.warning(f"Retrying in {sleep_time:.1f} seconds...")
+            if stop_event is None:
+                await asyncio.sleep(sleep_time)
+            else:
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=sleep_time)
+                except asyncio.TimeoutError:
+                    pass
+                else:
+                    logger.warning("Upload stopped, not retrying.")
+                    return None
+
         try:
-            response = requests.post(url, headers=headers, data=data, files=files, timeout=30)
+            _rewind_files(files)
+            # requests is blocking, run it in a thread so concurrent uploads can overlap
+            response = await asyncio.to_thread(
+                session.post, url, headers=headers, data=data, files=files, timeout=30
+            )
+            if response.status_code == 429:
+                retry_after = _retry_after_seconds(response)
+                logger.warning(f"[Attempt {attempt}] Rate limited by server (HTTP 429).")
             try:
-                resp_json = response.json()
+                resp_json = load_json_bytes(response.content)  # orjson when available
             except Exception:
-                logger.error(f"[Attempt {attempt}] ❌ Invalid JSON response: {response.text}")
+                # Error pages can be large, only the start is useful in the log
+                body_preview = response.content[:INVALID_RESPONSE_PREVIEW_BYTES].decode("utf-8", "replace")
+                logger.error(f"[Attempt {attempt}] ❌ Invalid JSON response: {body_preview}")
                 continue
 
-            status_ok = resp_json.get("status_code") == 200
-            success_block = resp_json.get("success", {})
-            image_block = resp_json.get("image", {})
+            success_block = resp_json.get("success")
+            image_block = resp_json.get("image")
 
-            success_message = (
-                isinstance(success_block, dict)
+            # Cheapest checks first, the message text is only inspected once everything else passed
+            if (
+                resp_json.get("status_code") == 200
+                and image_block
+                and isinstance(success_block, dict)
                 and success_block.get("code") == 200
-                and "upload" in success_block.get("message", "").lower()
-            )
-
-            if status_ok and success_message and image_block:
-                thumb_block = resp_json.get("image", {}).get("thumb", {})
+                and "upload" in (success_block.get("message") or "").lower()
+            ):
+                # the image block is already known, a null thumb must not break the result
+                thumb_block = image_block.get("thumb") or {}
                 logger.success(f"[Attempt {attempt}] ✅ Upload successful.")
 
                 result = {
@@ -58,33 +168,29 @@ async def upload_to_hamster(hamster_api_key, site_url, data, files=None):
         except requests.exceptions.RequestException as e:
             logger.error(f"[Attempt {attempt}] Network error: {e}")
 
-        if attempt < max_retries:
-            sleep_time = 2 * attempt
-            logger.warning(f"Retrying in {sleep_time} seconds...")
-            await asyncio.sleep(sleep_time)
-
     logger.error("❌ All upload attempts failed after retries.")
     return None
 
 
-async def hamster_upload_single_image(filepath, base_name, hamster_album_id, hamster_api_key, site_url, mode):
+async def hamster_upload_single_image(
+    filepath, base_name, hamster_album_id, hamster_api_key, site_url, mode, stop_event=None
+):
     """
     Prepare data for upload, build payload for upload_to_hamster() using multipart/form-data.
+    stop_event is passed on to upload_to_hamster to stop retrying.
     """
-    if not os.path.isfile(filepath):
-        logger.error(f"File not found: {filepath}")
-        return None
-
-    data = {
-        "title": f"{base_name}_{mode}",
-        "format": "json",
-        "nsfw": 1
-    }
+    data = {"title": f"{base_name}_{mode}", **_BASE_DATA}
     if hamster_album_id:
         data["album_id"] = hamster_album_id
 
-    with open(filepath, "rb") as f:
+    # The caller listed the file already, opening it is the only existence check needed
+    try:
+        f = open(filepath, "rb")
+    except OSError as e:
+        logger.error(f"Cannot open {filepath}: {e}")
+        return None
+    with f:
         files = {"source": (os.path.basename(filepath), f)}
-        resp_json = await upload_to_hamster(hamster_api_key, site_url, data, files)
+        resp_json = await upload_to_hamster(hamster_api_key, site_url, data, files, stop_event=stop_event)
 
     return resp_json
@@ -0,0 +1,99 @@
+import json
+import os
+import stat
+import uuid
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, stdlib json is used as a fallback
+    orjson = None
+
+
+def dump_json_bytes(obj, indent=True):
+    """
+    Serialize obj to UTF-8 encoded JSON bytes (orjson when available).
+    indent=False produces compact output, smaller and faster for files only machines read.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def load_json_bytes(raw):
+    """
+    Parse JSON from bytes (orjson when available).
+    Both parsers raise a json.JSONDecodeError subclass on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def load_json_file(path):
+    """
+    Read and parse a JSON file with a single read.
+    """
+    return load_json_bytes(Path(path).read_bytes())
+
+
+# Absolute path -> ((st_ino, st_mtime_ns, st_ctime_ns, st_size), parsed object) for load_json_cached
+_JSON_CACHE = {}
+
+
+def load_json_cached(path):
+    """
+    Read and parse a JSON file, reusing the last parse while its inode, mtime, ctime and size are unchanged.
+    The inode catches files replaced within one timestamp tick on coarse-timestamp filesystems (FAT, SMB),
+    and write_bytes_atomic drops the entry of any file this process writes.
+    The returned object is shared between callers, copy it before mutating.
+    """
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    key = (st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    data = load_json_file(path)
+    _JSON_CACHE[path] = (key, data)
+    return data
+
+
+def write_bytes_atomic(path, data):
+    """
+    Write data to path through a temporary file and os.replace,
+    so an interrupted write never leaves a truncated file behind.
+    The temporary name is unique per call and the data is fsynced before the rename,
+    so concurrent writers never share a temp file and a crash can't leave an empty target.
+    An existing target keeps its permission bits, e.g. a creds.secret restricted to its owner.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}.{uuid.uuid4().hex}")
+    try:
+        target_mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        target_mode = None
+    try:
+        # Owner-only until the target's mode is applied, a new file gets the usual umask default
+        fd = os.open(
+            tmp_path,
+            os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0),
+            0o600 if target_mode is not None else 0o666
+        )
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if target_mode is not None:
+            os.chmod(tmp_path, target_mode)
+        os.replace(tmp_path, path)
+        _JSON_CACHE.pop(os.path.abspath(path), None)
+    except Exception:
+        # Don't leave a half-written temporary file next to the target
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        raise